@@ -37,6 +37,25 @@ solarApiInstance.interceptors.response.use(
   }
 )
 
+// In-flight requests for near-static endpoints (status, summary)
+const inFlightRequests = new Map()
+
+// Share one pending request per key; the entry is dropped once it settles
+const getShared = (key, fetcher) => {
+  const pending = inFlightRequests.get(key)
+  if (pending) {
+    return pending
+  }
+  const promise = fetcher().finally(() => {
+    // Only remove our own entry
+    if (inFlightRequests.get(key) === promise) {
+      inFlightRequests.delete(key)
+    }
+  })
+  inFlightRequests.set(key, promise)
+  return promise
+}
+
 // Solar API functions
 export const solarApi = {
   // Get solar predictions from database
@@ -44,8 +63,7 @@ export const solarApi = {
     console.log('Fetching real solar predictions from /solar-predictions...')
     const response = await solarApiInstance.get('/solar-predictions', {
       params: { 
-        limit,
-        _t: Date.now() // Cache busting parameter
+        limit
       }
     })
     console.log('Solar API: Real predictions received successfully')
@@ -56,8 +74,7 @@ export const solarApi = {
   getForecastSolarPredictions: async (limit = 24, locationFilter = null) => {
     console.log('Fetching real forecast predictions from /solar-predictions/forecast...')
     const params = { 
-      limit,
-      _t: Date.now() // Cache busting parameter
+      limit
     }
     if (locationFilter) {
       params.location_filter = locationFilter
@@ -68,7 +85,7 @@ export const solarApi = {
   },
 
   // Get predictions summary
-  getPredictionsSummary: async (locationFilter = null) => {
+  getPredictionsSummary: (locationFilter = null) => getShared(`summary:${locationFilter || ''}`, async () => {
     console.log('Fetching real predictions summary from /solar-predictions/summary...')
     const params = {}
     if (locationFilter) {
@@ -77,7 +94,7 @@ export const solarApi = {
     const response = await solarApiInstance.get('/solar-predictions/summary', { params })
     console.log('Solar Summary API: Real data received successfully')
     return response.data
-  },
+  }),
 
   // Trigger auto forecast prediction pipeline
   triggerForecastPipeline: async (locationFilter = null, hoursAhead = 24) => {
@@ -91,12 +108,12 @@ export const solarApi = {
   },
 
   // Get database status
-  getDatabaseStatus: async () => {
+  getDatabaseStatus: () => getShared('status', async () => {
     console.log('Fetching real database status from /database/status...')
     const response = await solarApiInstance.get('/database/status')
     console.log('Database Status API: Real data received successfully')
     return response.data
-  },
+  }),
 
   // Solar power prediction endpoint (single prediction)
   predictSolarPower: async (inputData) => {
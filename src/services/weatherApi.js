@@ -66,8 +66,7 @@ export const weatherApi = {
         params: { 
           latitude, 
           longitude, 
-          hours,
-          _t: Date.now() // Cache busting parameter
+          hours
         }
       })
       console.log('Latest weather data received successfully')
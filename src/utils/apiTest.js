@@ -11,31 +11,38 @@ export const testAPIs = async () => {
   }
 
   // Test Weather API
-  try {
-    console.log('📡 Testing Weather API (port 5000)...')
-    const weatherData = await weatherApi.getWeatherData(5)
-    results.weather.status = 'success'
-    results.weather.data = weatherData
-    console.log('✅ Weather API: SUCCESS', weatherData)
-  } catch (error) {
-    results.weather.status = 'failed'
-    results.weather.error = error.message
-    console.log('❌ Weather API: FAILED', error.message)
+  const testWeather = async () => {
+    try {
+      console.log('📡 Testing Weather API (port 5000)...')
+      const weatherData = await weatherApi.getWeatherData(5)
+      results.weather.status = 'success'
+      results.weather.data = weatherData
+      console.log('✅ Weather API: SUCCESS', weatherData)
+    } catch (error) {
+      results.weather.status = 'failed'
+      results.weather.error = error.message
+      console.log('❌ Weather API: FAILED', error.message)
+    }
   }
 
   // Test Solar API
-  try {
-    console.log('📡 Testing Solar API (port 5003)...')
-    const solarStatus = await solarApi.getDatabaseStatus()
-    results.solar.status = 'success'
-    results.solar.data = solarStatus
-    console.log('✅ Solar API: SUCCESS', solarStatus)
-  } catch (error) {
-    results.solar.status = 'failed'
-    results.solar.error = error.message
-    console.log('❌ Solar API: FAILED', error.message)
+  const testSolar = async () => {
+    try {
+      console.log('📡 Testing Solar API (port 5003)...')
+      const solarStatus = await solarApi.getDatabaseStatus()
+      results.solar.status = 'success'
+      results.solar.data = solarStatus
+      console.log('✅ Solar API: SUCCESS', solarStatus)
+    } catch (error) {
+      results.solar.status = 'failed'
+      results.solar.error = error.message
+      console.log('❌ Solar API: FAILED', error.message)
+    }
   }
 
+  // Run both probes concurrently
+  await Promise.all([testWeather(), testSolar()])
+
   return results
 }
 
@@ -47,14 +54,16 @@ export const testWeatherEndpoints = async () => {
     { name: 'Connection Test', fn: () => weatherApi.testConnection() }
   ]
 
-  for (const endpoint of endpoints) {
-    try {
-      const result = await endpoint.fn()
-      console.log(`✅ ${endpoint.name}:`, result)
-    } catch (error) {
-      console.log(`❌ ${endpoint.name}:`, error.message)
+  // Fire all probes concurrently, then log results in order
+  const settled = await Promise.allSettled(endpoints.map(endpoint => endpoint.fn()))
+  settled.forEach((outcome, index) => {
+    const { name } = endpoints[index]
+    if (outcome.status === 'fulfilled') {
+      console.log(`✅ ${name}:`, outcome.value)
+    } else {
+      console.log(`❌ ${name}:`, outcome.reason?.message)
     }
-  }
+  })
 }
 
 export const testSolarEndpoints = async () => {
@@ -67,12 +76,14 @@ export const testSolarEndpoints = async () => {
     { name: 'Predictions Summary', fn: () => solarApi.getPredictionsSummary() }
   ]
 
-  for (const endpoint of endpoints) {
-    try {
-      const result = await endpoint.fn()
-      console.log(`✅ ${endpoint.name}:`, result)
-    } catch (error) {
-      console.log(`❌ ${endpoint.name}:`, error.message)
+  // Fire all probes concurrently, then log results in order
+  const settled = await Promise.allSettled(endpoints.map(endpoint => endpoint.fn()))
+  settled.forEach((outcome, index) => {
+    const { name } = endpoints[index]
+    if (outcome.status === 'fulfilled') {
+      console.log(`✅ ${name}:`, outcome.value)
+    } else {
+      console.log(`❌ ${name}:`, outcome.reason?.message)
     }
-  }
+  })
 }
\ No newline at end of file